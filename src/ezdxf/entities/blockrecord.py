@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 __all__ = ['BlockRecord']
 
+# lower case names of the modelspace and the active paperspace block, their entities are stored in the ENTITIES section
+ENTITIES_SECTION_BLOCK_NAMES = frozenset(('*model_space', '*paper_space'))
+
 acdb_blockrec = DefSubclass('AcDbBlockTableRecord', {
     'name': DXFAttr(2),
     'layout': DXFAttr(340, default='0'),  # handle to associated DXF LAYOUT object
@@ -97,7 +100,8 @@ class BlockRecord(DXFEntity):
 
         """
         self.block.export_dxf(tagwriter)
-        if not (self.is_modelspace or self.is_active_paperspace):
+        # same as: not (self.is_modelspace or self.is_active_paperspace), but with a single lower() call
+        if self.dxf.name.lower() not in ENTITIES_SECTION_BLOCK_NAMES:
             self.entity_space.export_dxf(tagwriter)
         self.endblk.export_dxf(tagwriter)
 
@@ -187,3 +191,10 @@ class BlockRecord(DXFEntity):
         """
         self.unlink_entity(entity)  # 1. unlink from entity space
         self.entitydb.delete_entity(entity)  # 2. delete from drawing database
+
+    def delete_all_entities(self) -> None:
+        """ Delete all entities from BLOCK_RECORD entity space and drawing database. """
+        # Removing entities one by one from the entity space is O(n²), just destroy all entities and clear the
+        # entity space at once.
+        self.entitydb.delete_entities(self.entity_space)
+        self.entity_space.clear()
@@ -175,13 +175,21 @@ class DXFGraphic(DXFEntity):
 
     def set_owner(self, owner: str, paperspace: int = 0) -> None:
         """ Set owner attribute and paperspace flag. (internal API)"""
-        self.dxf.owner = owner
+        dxf = self.dxf
+        dxf.owner = owner
         if paperspace:
-            self.dxf.paperspace = paperspace
+            dxf.paperspace = paperspace
         else:
-            self.dxf.discard('paperspace')
+            dxf.discard('paperspace')
+        # Linked entities (VERTEX, ATTRIB) have no linked entities by themselves, set attributes directly without
+        # the set_owner() call overhead, important for POLYLINE entities with many vertices.
         for e in self.linked_entities():  # type: DXFGraphic
-            e.set_owner(owner, paperspace)
+            dxf = e.dxf
+            dxf.owner = owner
+            if paperspace:
+                dxf.paperspace = paperspace
+            else:
+                dxf.discard('paperspace')
 
     def linked_entities(self) -> Iterable['DXFEntity']:
         """ Yield linked entities: VERTEX or ATTRIB, different handling than attached entities. (internal API)"""
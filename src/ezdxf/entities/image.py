@@ -11,7 +11,7 @@ from .dxfobj import DXFObject
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, DXFTag, UCS, Matrix44
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, UCS, Matrix44
 
 __all__ = ['Image', 'ImageDef', 'ImageDefReactor', 'RasterVariables', 'Wipeout']
 
@@ -65,8 +65,8 @@ class Image(DXFGraphic):
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
         if processor:
-            path_tags = processor.subclasses[2].pop_tags(codes=(14,))
-            self.load_boundary_path(path_tags)
+            # pop_tags() splits the subclass in a single pass, all popped tags are boundary vertices
+            self._boundary_path = [value for code, value in processor.subclasses[2].pop_tags(codes=(14,))]
             tags = processor.load_dxfattribs_into_namespace(dxf, self._CLS_ATTRIBS)
             if len(tags):
                 processor.log_unprocessed_tags(tags, subclass=self._CLS_ATTRIBS.name)
@@ -75,9 +75,6 @@ class Image(DXFGraphic):
                 self.reset_boundary_path()
         return dxf
 
-    def load_boundary_path(self, tags: Iterable['DXFTag']):
-        self._boundary_path = [value for code, value in tags if code == 14]
-
     @property
     def boundary_path(self):
         """
@@ -121,27 +118,31 @@ class Image(DXFGraphic):
 
         """
         vertices = list(vertices)
-        if len(vertices):
-            if len(vertices) > 2 and vertices[-1] != vertices[0]:
+        count = len(vertices)
+        if count:
+            if count > 2 and vertices[-1] != vertices[0]:
                 vertices.append(vertices[0])  # close path, else AutoCAD crashes
+                count += 1
             self._boundary_path = vertices
             self.set_flag_state(self.USE_CLIPPING_BOUNDARY, state=True)
-            self.dxf.clipping = 1
-            self.dxf.clipping_boundary_type = 1 if len(vertices) < 3 else 2
-            self.dxf.count_boundary_points = len(self._boundary_path)
+            dxf = self.dxf
+            dxf.clipping = 1
+            dxf.clipping_boundary_type = 1 + (count > 2)  # 1 = rectangular; 2 = polygonal
+            dxf.count_boundary_points = count
         else:
             self.reset_boundary_path()
 
     def reset_boundary_path(self) -> None:
         """ Reset boundary path to the default rectangle [(-0.5, -0.5), (ImageSizeX-0.5, ImageSizeY-0.5)].
         """
+        dxf = self.dxf
         lower_left_corner = (-.5, -.5)
-        upper_right_corner = Vector(self.dxf.image_size) + lower_left_corner
+        upper_right_corner = Vector(dxf.image_size) + lower_left_corner
         self._boundary_path = [lower_left_corner, upper_right_corner[:2]]
         self.set_flag_state(Image.USE_CLIPPING_BOUNDARY, state=False)
-        self.dxf.clipping = 0
-        self.dxf.clipping_boundary_type = 1
-        self.dxf.count_boundary_points = 2
+        dxf.clipping = 0
+        dxf.clipping_boundary_type = 1
+        dxf.count_boundary_points = 2
 
     def get_image_def(self) -> 'ImageDef':
         """ Returns the associated IMAGEDEF entity. see :class:`ImageDef`."""
@@ -168,9 +169,10 @@ class Image(DXFGraphic):
         .. versionadded:: 0.13
 
         """
-        self.dxf.insert = m.transform(self.dxf.insert)
-        self.dxf.u_pixel = m.transform_direction(self.dxf.u_pixel)
-        self.dxf.v_pixel = m.transform_direction(self.dxf.v_pixel)
+        dxf = self.dxf
+        dxf.insert = m.transform(dxf.insert)
+        dxf.u_pixel = m.transform_direction(dxf.u_pixel)
+        dxf.v_pixel = m.transform_direction(dxf.v_pixel)
         return self
 
 
@@ -111,6 +111,14 @@ class EntityDB:
             del self[entity.dxf.handle]
             entity.destroy()
 
+    def delete_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """ Removes all `entities` from database and destroys them. """
+        database = self._database
+        for entity in entities:
+            if entity.is_alive:
+                del database[entity.dxf.handle]
+                entity.destroy()
+
     def duplicate_entity(self, entity: DXFEntity) -> DXFEntity:
         """
         Duplicates `entity` and its sub entities (VERTEX, ATTRIB, SEQEND) and store them with new handles in the
@@ -188,6 +196,8 @@ class EntitySpace:
     def __init__(self, entities=None):
         entities = entities or []
         self.entities = list(e for e in entities if e.is_alive)
+        # Incremented by each change of the stored entities, can be used to validate cached query results.
+        self.mod_counter = 0
 
     def __iter__(self) -> Iterable['DXFEntity']:
         """ Iterable of all entities. """
@@ -215,6 +225,7 @@ class EntitySpace:
     def purge(self):
         """ Remove deleted entities. """
         self.entities = list(self)
+        self.mod_counter += 1
 
     def reorder(self, order: int = 1) -> None:
         """ Reorder entities in place.
@@ -231,11 +242,13 @@ class EntitySpace:
             return  # do nothing
 
         self.entities.sort(key=lambda e: e.priority, reverse=reverse)
+        self.mod_counter += 1
 
     def add(self, entity: 'DXFEntity') -> None:
         """ Add `entity`. """
         assert isinstance(entity, DXFEntity), type(entity)
         self.entities.append(entity)
+        self.mod_counter += 1
 
     def extend(self, entities: Iterable['DXFEntity']) -> None:
         """ Add multiple `entities`."""
@@ -277,8 +290,10 @@ class EntitySpace:
     def remove(self, entity: 'DXFEntity') -> None:
         """ Remove `entity`. """
         self.entities.remove(entity)
+        self.mod_counter += 1
 
     def clear(self) -> None:
         """ Remove all entities. """
         # do not delete database objects - entity space just manage handles
         self.entities = list()
+        self.mod_counter += 1
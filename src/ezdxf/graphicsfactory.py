@@ -26,6 +26,8 @@ if TYPE_CHECKING:  # import forward references
 
 
 class CreatorInterface:
+    __slots__ = ('doc',)
+
     def __init__(self, doc: 'Drawing'):
         self.doc = doc
 
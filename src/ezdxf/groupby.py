@@ -60,7 +60,9 @@ def groupby(entities: Iterable['DXFEntity'], dxfattrib: str = '', key: 'KeyFunc'
     if all((dxfattrib, key)):
         raise DXFValueError('Specify a dxfattrib or a key function, but not both.')
     if dxfattrib != '':
-        key = lambda entity: entity.get_dxf_attrib(dxfattrib, None)
+        # same as entity.get_dxf_attrib(dxfattrib, None) without the method call overhead, operator.attrgetter()
+        # is not usable, because it would return the DXF default value for unset attributes
+        key = lambda entity: entity.dxf.get(dxfattrib)
     if key is None:
         raise DXFValueError('no valid argument found, specify a dxfattrib or a key function, but not both.')
 
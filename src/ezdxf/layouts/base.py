@@ -18,6 +18,10 @@ SUPPORTED_FOREIGN_ENTITY_TYPES = {
 
 
 class BaseLayout(CreatorInterface):
+    # Layout objects have no dynamic attributes, __slots__ for all layout classes reduces the memory footprint,
+    # important for the BlockLayout objects of documents with many block definitions.
+    __slots__ = ('entity_space', 'block_record')
+
     def __init__(self, block_record: 'BlockRecord'):
         super().__init__(block_record.doc)
         self.entity_space = block_record.entity_space
@@ -229,9 +233,7 @@ class BaseLayout(CreatorInterface):
         Delete all entities from layout entity space and from entity database, this destroys all entities in this
         layout.
         """
-        # noinspection PyTypeChecker
-        for entity in list(self):  # temp list, because delete modifies the base data structure of the iterator
-            self.delete_entity(entity)
+        self.block_record.delete_all_entities()
 
     def get_entity_by_handle(self, handle: str) -> 'DXFGraphic':
         """
@@ -259,7 +261,7 @@ class BaseLayout(CreatorInterface):
                  supported by entity.
 
         """
-        return groupby(iter(self), dxfattrib, key)
+        return groupby(self.entity_space, dxfattrib, key)
 
     def move_to_layout(self, entity: 'DXFGraphic', layout: 'BaseLayout') -> None:
         """
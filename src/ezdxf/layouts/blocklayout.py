@@ -1,11 +1,11 @@
 # Created: 2019-02-18
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union, Tuple, List
 from .base import BaseLayout
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import DXFGraphic, AttDef
+    from ezdxf.eztypes import DXFGraphic, AttDef, BlockRecord, EntitySpace
 
 
 class BlockLayout(BaseLayout):
@@ -14,6 +14,13 @@ class BlockLayout(BaseLayout):
     in the :class:`BlocksSection` class. It represents a DXF Block.
 
     """
+    __slots__ = ('_attdefs', '_attdef_cache_key')
+
+    def __init__(self, block_record: 'BlockRecord'):
+        super().__init__(block_record)
+        # ATTDEF entities in entity space order, validated by entity space and its modification counter
+        self._attdefs = []  # type: List[AttDef]
+        self._attdef_cache_key = None  # type: Optional[Tuple[EntitySpace, int]]
 
     def __contains__(self, entity: Union['DXFGraphic', str]) -> bool:
         """ Returns ``True`` if block contains `entity`.
@@ -69,9 +76,23 @@ class BlockLayout(BaseLayout):
     def scale_uniformly(self, value: bool):
         self.block_record.dxf.scale = int(value)
 
+    def _cached_attdefs(self) -> List['AttDef']:
+        """ Returns cached list of all ATTDEF entities, rebuilds the cache if the entity space was modified. """
+        entity_space = self.entity_space
+        cache_key = (entity_space, entity_space.mod_counter)
+        if self._attdef_cache_key != cache_key:
+            self._attdefs = [entity for entity in entity_space if entity.dxftype() == 'ATTDEF']
+            self._attdef_cache_key = cache_key
+        attdefs = self._attdefs
+        # ATTDEF entities can be destroyed without removing them from the entity space
+        if not all(attdef.is_alive for attdef in attdefs):
+            attdefs = [attdef for attdef in attdefs if attdef.is_alive]
+            self._attdefs = attdefs
+        return attdefs
+
     def attdefs(self) -> Iterable['AttDef']:
         """ Returns iterable of all :class:`~ezdxf.entities.attrib.Attdef` entities. """
-        return (entity for entity in self if entity.dxftype() == 'ATTDEF')
+        return iter(self._cached_attdefs())
 
     def has_attdef(self, tag: str) -> bool:
         """ Returns ``True`` if an :class:`~ezdxf.entities.attrib.Attdef` for `tag` exist. """
@@ -79,9 +100,12 @@ class BlockLayout(BaseLayout):
 
     def get_attdef(self, tag: str) -> Optional['DXFGraphic']:
         """ Returns attached :class:`~ezdxf.entities.attrib.Attdef` entity by `tag` name. """
-        for attdef in self.attdefs():
-            if tag == attdef.dxf.tag:
+        # The tag of an ATTDEF entity can be changed at any time without modifying the entity space,
+        # therefore no index by tag, first ATTDEF in entity space order wins for duplicate tags.
+        for attdef in self._cached_attdefs():
+            if attdef.dxf.tag == tag:
                 return attdef
+        return None
 
     def get_attdef_text(self, tag: str, default: str = None) -> str:
         """
@@ -100,4 +124,4 @@ class BlockLayout(BaseLayout):
 
     def get_const_attdefs(self) -> Iterable['AttDef']:
         """ Returns iterable for all constant ATTDEF entities. (internal API) """
-        return (attdef for attdef in self.attdefs() if attdef.is_const)
+        return [attdef for attdef in self._cached_attdefs() if attdef.is_const]
@@ -2,6 +2,7 @@
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Iterable, Any, Union, List, Tuple, cast, Optional, Dict
+from operator import itemgetter
 from ezdxf.entitydb import EntitySpace
 from ezdxf.lldxf.const import DXFKeyError, DXFValueError, DXF2010, DXFTypeError, STD_SCALES
 from .base import BaseLayout
@@ -11,6 +12,38 @@ if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex, Viewport, Drawing, Dictionary, DXFLayout, DXFGraphic, BlockLayout
 
 
+# paper units: DXF units name, plot_paper_units enum, unit factor to mm
+PAPER_UNITS = {
+    'mm': ('MM', 1, 1.0),
+    'inch': ('Inches', 0, 25.4),  # inch to mm
+}
+
+# conversion factor from mm to plot paper units, key is the plot_paper_units enum: 0 = inch, 1 = mm, 2 = pixel
+MM_TO_PLOT_PAPER_UNITS = {0: 1.0 / 25.4}
+
+
+def get_paper_units(units: str) -> Tuple[str, int, float]:
+    """ Returns (DXF units name, plot_paper_units, unit factor to mm) for `units` ``'mm'`` or ``'inch'``. """
+    units = units.lower()
+    if units.startswith('inch'):
+        units = 'inch'
+    try:
+        return PAPER_UNITS[units]
+    except KeyError:
+        raise DXFValueError('Supported units: "mm" and "inch"')
+
+
+# (numerator, denominator) by standard scale type 0-32, 0 = scaled to fit
+STD_SCALE_TABLE = tuple(STD_SCALES.get(index, (1, 1)) for index in range(33))
+
+
+def get_std_scale(standard_scale: int) -> Tuple[float, float]:
+    """ Returns (numerator, denominator) for `standard_scale` type 0-32. """
+    if 0 <= standard_scale < len(STD_SCALE_TABLE):
+        return STD_SCALE_TABLE[standard_scale]
+    raise DXFValueError("valid standard scale types: 0-32")
+
+
 def get_block_entity_space(doc: 'Drawing', block_record_handle: str) -> 'EntitySpace':
     block_record = doc.entitydb[block_record_handle]
     return block_record.entity_space
@@ -42,6 +75,8 @@ class Layout(BaseLayout):
     same object.
 
     """
+    __slots__ = ('dxf_layout',)
+
     # plot_layout_flags of LAYOUT entity
     PLOT_VIEWPORT_BORDERS = 1
     SHOW_PLOT_STYLES = 2
@@ -58,11 +93,32 @@ class Layout(BaseLayout):
     INITIALIZING = 8192
     PREV_PLOT_INIT = 16384
 
+    # plot_layout_flags by name of the flag setter method, see configure_plot_flags()
+    PLOT_FLAGS = {
+        'plot_viewport_borders': PLOT_VIEWPORT_BORDERS,
+        'show_plot_styles': SHOW_PLOT_STYLES,
+        'plot_centered': PLOT_CENTERED,
+        'plot_hidden': PLOT_HIDDEN,
+        'use_standard_scale': USE_STANDARD_SCALE,
+        'use_plot_styles': PLOT_PLOTSTYLES,
+        'scale_lineweights': SCALE_LINEWEIGHTS,
+        'print_lineweights': PRINT_LINEWEIGHTS,
+        'draw_viewports_first': DRAW_VIEWPORTS_FIRST,
+        'model_type': MODEL_TYPE,
+        'update_paper': UPDATE_PAPER,
+        'zoom_to_paper_on_update': ZOOM_TO_PAPER_ON_UPDATE,
+        'plot_flags_initializing': INITIALIZING,
+        'prev_plot_init': PREV_PLOT_INIT,
+    }
+
     def __init__(self, layout: 'DXFLayout', doc: 'Drawing'):
         self.dxf_layout = layout
-        block_record = doc.entitydb[layout.dxf.block_record_handle]
+        dxf = layout.dxf
+        # single database lookup, the block record is the central management structure and also hosts the
+        # entity space
+        block_record = doc.entitydb[dxf.block_record_handle]
         # link maybe broken
-        block_record.dxf.layout = layout.dxf.handle
+        block_record.dxf.layout = dxf.handle
         super().__init__(block_record)
 
     @classmethod
@@ -123,13 +179,16 @@ class Layout(BaseLayout):
         Set `owner` and `paperspace` attributes of entities hosted by this layout to correct values.
 
         """
+        if not len(self.entity_space):  # nothing to repair, avoids block record name checks
+            return
         layout_key = self.layout_key
         paperspace = 0 if self.is_modelspace else 1
-        for entity in self:
-            if entity.dxf.owner != layout_key:
-                entity.dxf.owner = layout_key
-            if entity.dxf.paperspace != paperspace:
-                entity.dxf.paperspace = paperspace
+        for entity in self.entity_space:
+            dxf = entity.dxf
+            if dxf.owner != layout_key:
+                dxf.owner = layout_key
+            if dxf.paperspace != paperspace:
+                dxf.paperspace = paperspace
 
     def __contains__(self, entity: Union['DXFGraphic', str]) -> bool:
         """ Returns ``True`` if `entity` is stored in this layout.
@@ -139,8 +198,9 @@ class Layout(BaseLayout):
 
         """
         if isinstance(entity, str):  # entity is a handle string
-            entity = self.entitydb[entity]
-        return entity.dxf.owner == self.layout_key
+            entity = self.doc.entitydb[entity]
+        # layout key is the handle of the block record, avoids the property call overhead
+        return entity.dxf.owner == self.block_record.dxf.handle
 
     def destroy(self) -> None:
         """ Delete all entities and the layout itself from entity database and all linked structures.
@@ -334,6 +394,26 @@ class Layout(BaseLayout):
     def set_plot_flags(self, flag, state: bool = True) -> None:
         self.dxf_layout.set_flag_state(flag, state=state, name='plot_layout_flags')
 
+    def configure_plot_flags(self, **flags: bool) -> None:
+        """
+        Set multiple plot layout flags at once, the argument names are the names of the flag setter methods,
+        e.g. ``configure_plot_flags(plot_centered=True, use_standard_scale=False)``.
+
+        """
+        set_bits = 0
+        clear_bits = 0
+        for name, state in flags.items():
+            try:
+                flag = self.PLOT_FLAGS[name]
+            except KeyError:
+                raise DXFValueError(f'Invalid plot layout flag "{name}".')
+            if state:
+                set_bits |= flag
+            else:
+                clear_bits |= flag
+        dxf = self.dxf_layout.dxf
+        dxf.plot_layout_flags = (dxf.plot_layout_flags & ~clear_bits) | set_bits
+
 
 class Modelspace(Layout):
     """
@@ -342,6 +422,8 @@ class Modelspace(Layout):
     ``Model``.
 
     """
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """ Name of modelspace is fixed as ``'Model'``. """
@@ -404,6 +486,14 @@ class Paperspace(Layout):
     for AutoCAD important and it is not documented in the DXF reference.
 
     """
+    __slots__ = ('_viewports', '_viewports_cache_key')
+
+    def __init__(self, layout: 'DXFLayout', doc: 'Drawing'):
+        super().__init__(layout, doc)
+        # cached VIEWPORT entities in order of appearance, validated by entity space and its modification counter
+        self._viewports = []  # type: List[Viewport]
+        self._viewports_cache_key = None  # type: Optional[Tuple[EntitySpace, int]]
+
     def rename(self, name: str) -> None:
         """ Rename layout to `name`, changes the name displayed in tabs by CAD applications, not the internal BLOCK
         name.
@@ -416,9 +506,18 @@ class Paperspace(Layout):
         objects, sorted by id, the first entity is always the paperspace view with an id of ``1``.
 
         """
-        vports = [entity for entity in self if entity.dxftype() == 'VIEWPORT']
-        vports.sort(key=lambda e: e.dxf.id)
-        return vports
+        entity_space = self.entity_space
+        cache_key = (entity_space, entity_space.mod_counter)
+        if self._viewports_cache_key != cache_key:
+            # DXF type strings are interned class constants, DXFTYPE access avoids the dxftype() method call
+            self._viewports = [entity for entity in entity_space if entity.DXFTYPE == 'VIEWPORT']
+            self._viewports_cache_key = cache_key
+        # Viewport ids can be changed at any time and viewports can be destroyed without removing them from the
+        # entity space, therefore sorting by id and checking the is_alive state is not cached.
+        # sort key (id) is the first item, the C-implemented itemgetter() avoids a lambda call for each viewport
+        vports = [(entity.dxf.id, entity) for entity in self._viewports if entity.is_alive]
+        vports.sort(key=itemgetter(0))
+        return [entity for _, entity in vports]
 
     def renumber_viewports(self) -> None:
         """ Reassign viewport ids. (internal API) """
@@ -431,7 +530,6 @@ class Paperspace(Layout):
                      view_height: float,
                      dxfattribs: dict = None) -> 'Viewport':
         """ Add a new :class:`~ezdxf.entities.Viewport` entity. """
-        dxfattribs = dxfattribs or {}
         width, height = size
         attribs = {
             'center': center,
@@ -442,7 +540,8 @@ class Paperspace(Layout):
             'view_center_point': view_center_point,
             'view_height': view_height,
         }
-        attribs.update(dxfattribs)
+        if dxfattribs:
+            attribs.update(dxfattribs)
         viewport = cast('Viewport', self.new_entity('VIEWPORT', attribs))
         viewport.dxf.id = viewport.get_next_viewport_id()
         return viewport
@@ -457,27 +556,18 @@ class Paperspace(Layout):
     def add_new_main_viewport(self) -> None:
         """ Add a new main viewport. (internal API) """
         dxf = self.dxf_layout.dxf
-        if dxf.plot_paper_units == 0:  # inches
-            unit_factor = 25.4
-        else:  # mm
-            unit_factor = 1.0
-
         # all paper parameters in mm!
         # all viewport parameters in paper space units inch/mm + scale factor!
-        scale_factor = dxf.scale_denominator / dxf.scale_numerator
-
-        def paper_units(value):
-            return value / unit_factor * scale_factor
-
-        paper_width = paper_units(dxf.paper_width)
-        paper_height = paper_units(dxf.paper_height)
+        factor = MM_TO_PLOT_PAPER_UNITS.get(dxf.plot_paper_units, 1.0) * dxf.scale_denominator / dxf.scale_numerator
+        paper_width = dxf.paper_width * factor
+        paper_height = dxf.paper_height * factor
         # plot origin offset
-        x_offset = paper_units(dxf.plot_origin_x_offset)
-        y_offset = paper_units(dxf.plot_origin_y_offset)
+        x_offset = dxf.plot_origin_x_offset * factor
+        y_offset = dxf.plot_origin_y_offset * factor
 
         # printing area
-        printable_width = paper_width - paper_units(dxf.left_margin) - paper_units(dxf.right_margin)
-        printable_height = paper_height - paper_units(dxf.bottom_margin) - paper_units(dxf.top_margin)
+        printable_width = paper_width - dxf.left_margin * factor - dxf.right_margin * factor
+        printable_height = paper_height - dxf.bottom_margin * factor - dxf.top_margin * factor
 
         # AutoCAD viewport (window) size
         vp_width = paper_width * 1.1
@@ -537,7 +627,7 @@ class Paperspace(Layout):
             standard_scale = 16
         elif isinstance(scale, int):
             standard_scale = scale
-            scale = STD_SCALES.get(standard_scale, (1, 1))
+            scale = get_std_scale(standard_scale)
         else:
             raise DXFTypeError("scale has to be an int or a tuple(numerator, denominator)")
         if scale[0] == 0:
@@ -548,24 +638,14 @@ class Paperspace(Layout):
         self.use_standard_scale(False)  # works best, don't know why
         paper_width, paper_height = size
         margin_top, margin_right, margin_bottom, margin_left = margins
-        units = units.lower()
-        if units.startswith('inch'):
-            units = 'Inches'
-            plot_paper_units = 0
-            unit_factor = 25.4  # inch to mm
-        elif units == 'mm':
-            units = 'MM'
-            plot_paper_units = 1
-            unit_factor = 1.0
-        else:
-            raise DXFValueError('Supported units: "mm" and "inch"')
+        units, plot_paper_units, unit_factor = get_paper_units(units)
 
         # Setup PLOTSETTINGS
         # all paper sizes in mm
         dxf = self.dxf_layout.dxf
         dxf.page_setup_name = ''
         dxf.plot_configuration_file = device
-        dxf.paper_size = '{0}_({1:.2f}_x_{2:.2f}_{3})'.format(name, paper_width, paper_height, units)
+        dxf.paper_size = f'{name}_({paper_width:.2f}_x_{paper_height:.2f}_{units})'
         dxf.left_margin = margin_left * unit_factor
         dxf.bottom_margin = margin_bottom * unit_factor
         dxf.right_margin = margin_right * unit_factor
@@ -594,18 +674,15 @@ class Paperspace(Layout):
 
         """
         dxf = self.dxf_layout.dxf
-        if dxf.plot_paper_units == 0:  # inch
-            unit_factor = 25.4
-        else:  # mm
-            unit_factor = 1.0
+        factor = MM_TO_PLOT_PAPER_UNITS.get(dxf.plot_paper_units, 1.0)
 
         # all paper sizes are stored in mm
-        paper_width = dxf.paper_width / unit_factor  # in plot paper units
-        paper_height = dxf.paper_height / unit_factor  # in plot paper units
-        left_margin = dxf.left_margin / unit_factor
-        bottom_margin = dxf.bottom_margin / unit_factor
-        x_offset = dxf.plot_origin_x_offset / unit_factor
-        y_offset = dxf.plot_origin_y_offset / unit_factor
+        paper_width = dxf.paper_width * factor  # in plot paper units
+        paper_height = dxf.paper_height * factor  # in plot paper units
+        left_margin = dxf.left_margin * factor
+        bottom_margin = dxf.bottom_margin * factor
+        x_offset = dxf.plot_origin_x_offset * factor
+        y_offset = dxf.plot_origin_y_offset * factor
         # plot origin is the lower left corner of the printable paper area
         # limits are the paper borders relative to the plot origin
         shift_x = left_margin + x_offset
@@ -640,7 +717,7 @@ class Paperspace(Layout):
             raise DXFValueError("valid rotation values: 0-3")
 
         if isinstance(scale, int):
-            scale = STD_SCALES.get(scale, (1, 1))
+            scale = get_std_scale(scale)
 
         if scale[0] == 0:
             raise DXFValueError("scale numerator can't be 0.")
@@ -650,21 +727,7 @@ class Paperspace(Layout):
         scale_factor = scale[1] / scale[0]
 
         # TODO: don't know how to set inch or mm mode in R12
-        units = units.lower()
-        if units.startswith('inch'):
-            units = 'Inches'
-            plot_paper_units = 0
-            unit_factor = 25.4  # inch to mm
-        elif units == 'mm':
-            units = 'MM'
-            plot_paper_units = 1
-            unit_factor = 1.0
-        else:
-            raise DXFValueError('Supported units: "mm" and "inch"')
-
-        # all viewport parameters are scaled paper space units
-        def paper_units(value):
-            return value * scale_factor
+        units, plot_paper_units, unit_factor = get_paper_units(units)
 
         # TODO: don't know how paper setup in DXF R12 works
         paper_width, paper_height = size
@@ -672,8 +735,9 @@ class Paperspace(Layout):
         # TODO: don't know how margins setup in DXF R12 works
         margin_top, margin_right, margin_bottom, margin_left = margins
 
-        paper_width = paper_units(size[0])
-        paper_height = paper_units(size[1])
+        # all viewport parameters are scaled paper space units
+        paper_width = size[0] * scale_factor
+        paper_height = size[1] * scale_factor
 
         plimmin = self.doc.header['$PLIMMIN'] = (0, 0)
         plimmax = self.doc.header['$PLIMMAX'] = (paper_width, paper_height)
@@ -684,8 +748,8 @@ class Paperspace(Layout):
         pextmax = self.doc.header['$PEXTMAX'] = (paper_width, paper_height, 0)
 
         # printing area
-        printable_width = paper_width - paper_units(margin_left) - paper_units(margin_right)
-        printable_height = paper_height - paper_units(margin_bottom) - paper_units(margin_top)
+        printable_width = paper_width - margin_left * scale_factor - margin_right * scale_factor
+        printable_height = paper_height - margin_bottom * scale_factor - margin_top * scale_factor
 
         # AutoCAD viewport (window) size
         vp_width = paper_width * 1.1
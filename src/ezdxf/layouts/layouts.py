@@ -3,8 +3,9 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Dict, Iterable, List, cast, Optional
 import logging
-from ezdxf.lldxf.const import DXFKeyError, DXFValueError, DXFInternalEzdxfError
-from ezdxf.lldxf.const import MODEL_SPACE_R2000, PAPER_SPACE_R2000, TMP_PAPER_SPACE_NAME
+from operator import itemgetter
+from ezdxf.lldxf.const import DXFKeyError, DXFValueError, DXFInternalEzdxfError, DXFTableEntryError
+from ezdxf.lldxf.const import MODEL_SPACE_R2000, PAPER_SPACE_R2000
 from ezdxf.lldxf.validator import is_valid_name
 from .layout import Layout, Modelspace, Paperspace
 from ezdxf.entities import DXFEntity
@@ -20,6 +21,9 @@ class Layouts:
         """ Default constructor. (internal API) """
         self.doc = doc
         self._layouts = {}  # type: Dict[str, Layout]
+        self._layouts_by_key = {}  # type: Dict[str, Layout] # key: layout key (block record handle)
+        self._active_layout = None  # type: Optional[Paperspace]
+        self._names_in_taborder = None  # type: Optional[List[str]] # cached result of names_in_taborder()
         self._dxf_layouts = self.doc.rootdict['ACAD_LAYOUT']  # type: Dictionary # key: layout name; value: Layout()
 
     @classmethod
@@ -44,10 +48,14 @@ class Layouts:
         dxfattribs['owner'] = self._dxf_layouts.dxf.handle
         layout = cls.new(name, block_name, self.doc, dxfattribs=dxfattribs)
         self._dxf_layouts[name] = layout.dxf_layout
-        self._layouts[name] = layout
-
+        self._add_layout(name, layout)
         return layout
 
+    def _add_layout(self, name: str, layout: 'Layout') -> None:
+        self._layouts[name] = layout
+        self._layouts_by_key[layout.layout_key] = layout
+        self._names_in_taborder = None
+
     def unique_paperspace_name(self) -> str:
         """ Returns a unique paperspace name. (internal API)"""
         blocks = self.doc.blocks
@@ -72,18 +80,18 @@ class Layouts:
         if not is_valid_name(name):
             raise DXFValueError('Layout name contains invalid characters.')
 
-        if name in self._layouts:
+        layouts = self._layouts
+        if name in layouts:
             raise DXFValueError(f'Layout "{name}" already exists')
 
         dxfattribs = dict(dxfattribs or {})  # copy attribs
         dxfattribs['owner'] = self._dxf_layouts.dxf.handle
-        dxfattribs.setdefault('taborder', len(self._layouts) + 1)
+        dxfattribs.setdefault('taborder', len(layouts) + 1)
         block_name = self.unique_paperspace_name()
         layout = Paperspace.new(name, block_name, self.doc, dxfattribs=dxfattribs)
 
         self._dxf_layouts[name] = layout.dxf_layout
-        self._layouts[name] = layout
-
+        self._add_layout(name, layout)
         return layout
 
     @classmethod
@@ -137,7 +145,7 @@ class Layouts:
             layout = Paperspace.load(dxf_layout, self.doc)
 
         self._dxf_layouts[name] = layout.dxf_layout
-        self._layouts[name] = layout
+        self._add_layout(name, layout)
         return layout
 
     def setup_from_rootdict(self) -> None:
@@ -147,7 +155,7 @@ class Layouts:
                 layout = Modelspace(dxf_layout, self.doc)
             else:
                 layout = Paperspace(dxf_layout, self.doc)
-            self._layouts[name] = layout
+            self._add_layout(name, layout)
 
     def __len__(self) -> int:
         """ Returns count of existing layouts, including the modelspace layout. """
@@ -176,12 +184,20 @@ class Layouts:
         Returns :class:`~ezdxf.layouts.Layout` by `name`.
 
         Args:
-            name: layout name as shown in tab, e.g. ``'Model'`` for modelspace
+            name: layout name as shown in tab, e.g. ``'Model'`` for modelspace, ``None`` for the first paperspace
+                  layout in tab order
 
         """
-        if name is None:
-            first_layout_name = self.names_in_taborder()[1]
-            return self._layouts[first_layout_name]
+        if name is None:  # first paperspace layout in tab order
+            first_layout = min(
+                ((layout.dxf.taborder, layout_name, layout) for layout_name, layout in self._layouts.items()
+                 if layout_name != 'Model'),
+                key=itemgetter(0, 1),
+                default=None,
+            )
+            if first_layout is None:
+                raise DXFKeyError('No paperspace layout exist.')
+            return first_layout[2]
         else:
             return self._layouts[name]
 
@@ -209,11 +225,29 @@ class Layouts:
         layout.rename(new_name)
         del self._layouts[old_name]
         self._layouts[new_name] = layout
+        self._names_in_taborder = None
 
     def names_in_taborder(self) -> List[str]:
         """ Returns all layout names in tab order as shown in :term:`CAD` applications. """
-        names = [(layout.dxf.taborder, name) for name, layout in self._layouts.items()]
-        return [name for order, name in sorted(names)]
+        names = self._names_in_taborder
+        if names is None or not self._is_in_taborder(names):
+            names = [(layout.dxf.taborder, name) for name, layout in self._layouts.items()]
+            names = [name for order, name in sorted(names)]
+            self._names_in_taborder = names
+        return list(names)
+
+    def _is_in_taborder(self, names: List[str]) -> bool:
+        # The taborder attribute can be changed by the user at any time, the cached names are valid as long as the
+        # (taborder, name) keys are still in ascending order, the cache is reset if layouts were added, renamed or
+        # deleted.
+        layouts = self._layouts
+        prev_key = None
+        for name in names:
+            key = (layouts[name].dxf.taborder, name)
+            if prev_key is not None and key < prev_key:
+                return False
+            prev_key = key
+        return True
 
     def get_layout_for_entity(self, entity: 'DXFEntity') -> 'Layout':
         """ Returns the owner layout for a DXF `entity`. """
@@ -226,11 +260,9 @@ class Layouts:
         """ Returns a layout by its `layout_key`. (internal API) """
         assert isinstance(layout_key, str), type(layout_key)
         try:
-            block_record = self.doc.entitydb[layout_key]
-            dxf_layout = self.doc.entitydb[block_record.dxf.layout]
+            return self._layouts_by_key[layout_key]
         except KeyError:
             raise DXFKeyError(f'Layout with key "{layout_key}" does not exist.')
-        return self.get(dxf_layout.dxf.name)
 
     def get_active_layout_key(self):
         """ Returns layout kay for the active paperspace layout. (internal API) """
@@ -246,13 +278,12 @@ class Layouts:
         old_active_layout_key = self.get_active_layout_key()
         if old_active_layout_key == new_active_layout.layout_key:
             return  # layout 'name' is already the active layout
+        self._activate_layout(new_active_layout)
 
-        blocks = self.doc.blocks
-        new_active_paper_space_name = new_active_layout.block_record_name
-
-        blocks.rename_block(PAPER_SPACE_R2000, TMP_PAPER_SPACE_NAME)
-        blocks.rename_block(new_active_paper_space_name, PAPER_SPACE_R2000)
-        blocks.rename_block(TMP_PAPER_SPACE_NAME, new_active_paper_space_name)
+    def _activate_layout(self, new_active_layout: 'Layout') -> None:
+        # new_active_layout is not the active layout
+        self.doc.blocks.swap_block_names(PAPER_SPACE_R2000, new_active_layout.block_record_name)
+        self._active_layout = cast(Paperspace, new_active_layout)
 
     def delete(self, name: str) -> None:
         """ Delete layout `name` and all entities owned by it.
@@ -271,12 +302,17 @@ class Layouts:
 
         layout = self._layouts[name]
         if layout.layout_key == self.get_active_layout_key():  # name is the active layout
-            for layout_name in self.names():
+            for layout_name, other_layout in self._layouts.items():
                 if layout_name not in (name, 'Model'):  # set any other layout as active layout
-                    self.set_active_layout(layout_name)
+                    self._activate_layout(other_layout)
                     break
-        self._dxf_layouts.remove(layout.name)
-        del self._layouts[layout.name]
+        if layout is self._active_layout:
+            self._active_layout = None
+        # layout.name is equal to name, avoids the attribute lookup by the DXF namespace
+        self._dxf_layouts.remove(name)
+        del self._layouts[name]
+        del self._layouts_by_key[layout.layout_key]
+        self._names_in_taborder = None
         layout.destroy()
 
     def active_layout(self) -> Paperspace:
@@ -284,7 +320,21 @@ class Layouts:
         Returns the active paperspace layout.
 
         """
-        for layout in self:
-            if layout.is_active_paperspace:
-                return cast(Paperspace, layout)
-        raise DXFInternalEzdxfError('No active paperspace layout found.')
+        # The active layout can also be changed by renaming the layout blocks, therefore validate the cached layout.
+        active_layout = self._active_layout
+        if active_layout is not None and active_layout.is_active_paperspace:
+            return active_layout
+        try:  # fast path: lookup the *Paper_Space block record by table key
+            active_layout = self._layouts_by_key[self.get_active_layout_key()]
+        except (KeyError, DXFTableEntryError):
+            active_layout = None
+        if active_layout is None or not active_layout.is_active_paperspace:
+            # block record table and block record names out of sync
+            for layout in self:
+                if layout.is_active_paperspace:
+                    active_layout = layout
+                    break
+            else:
+                raise DXFInternalEzdxfError('No active paperspace layout found.')
+        self._active_layout = cast(Paperspace, active_layout)
+        return self._active_layout
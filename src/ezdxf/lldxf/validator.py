@@ -246,7 +246,8 @@ def is_dxf_stream(stream: TextIO) -> bool:
 
 
 def is_valid_layer_name(name: str) -> bool:
-    return not bool(INVALID_LAYER_NAME_CHARACTERS.intersection(set(name)))
+    # isdisjoint() accepts any iterable and stops at the first common character, no temporary sets required
+    return INVALID_LAYER_NAME_CHARACTERS.isdisjoint(name)
 
 
 is_valid_name = is_valid_layer_name
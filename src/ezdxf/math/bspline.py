@@ -248,6 +248,8 @@ def normalize_knots(knots: List[float]) -> List[float]:
     """ Normalize knot vector into range [0, 1]. """
     min_val = min(knots)
     max_val = max(knots) - min_val
+    if min_val == 0.0 and max_val == 1.0:  # already normalized, (v - 0.0) / 1.0 == v
+        return [float(v) for v in knots]
     return [(v - min_val) / max_val for v in knots]
 
 
@@ -683,23 +685,15 @@ class Basis:
 
     def find_span(self, u: float) -> int:
         """ Determine the knot span index. """
-        # Linear search is more reliable than binary search of the Algorithm A2.1
-        # from The NURBS Book by Piegl & Tiller.
-        knots = self.knots
-        count = self.count
+        # The loop based binary search of the Algorithm A2.1 from The NURBS Book by Piegl & Tiller
+        # goes into an infinity loop for weird knot configurations like in
+        # Test 621 : test_weired_closed_spline(), bisect works for all non-decreasing knot vectors.
         p = self.order - 1
-        # if it is an standard clamped spline
-        if knots[p] == 0.0:  # use binary search
-            # This is fast and works most of the time,
-            # but Test 621 : test_weired_closed_spline()
-            # goes into an infinity loop, because of
-            # a weird knot configuration.
-            return bisect.bisect_right(knots, u, p, count) - 1
-        else:  # use linear search
-            for span in range(count):
-                if knots[span] > u:
-                    return span - 1
-            return count - 1
+        # The span is clamped into the range [p, count-1] without branching on the knot configuration,
+        # parameters outside of the valid domain [knots[p], knots[count]] are evaluated by the first or
+        # last polynomial segment, like NURBS-Python does. bisect_right() searches only in [p, count),
+        # so the result is always >= p - 1.
+        return max(bisect.bisect_right(self.knots, u, p, self.count) - 1, p)
 
     def basis_funcs(self, span: int, u: float) -> List[float]:
         # Source: The NURBS Book: Algorithm A2.2
@@ -714,9 +708,12 @@ class Basis:
             right[j] = knots[span + j] - u
             saved = 0.0
             for r in range(j):
-                temp = N[r] / (right[r + 1] + left[j - r])
-                N[r] = saved + right[r + 1] * temp
-                saved = left[j - r] * temp
+                # each list item is read only once
+                right_r = right[r + 1]
+                left_r = left[j - r]
+                temp = N[r] / (right_r + left_r)
+                N[r] = saved + right_r * temp
+                saved = left_r * temp
             N[j] = saved
         if self.is_rational:
             return self.span_weighting(N, span)
@@ -806,7 +803,15 @@ class Basis:
         p = self.order - 1
         span = self.find_span(u)
         N = self.basis_funcs(span, u)
-        return sum(N[i] * control_points[span - p + i] for i in range(p + 1))
+        # Accumulate the coordinates as floats, this avoids the creation of 2 * order
+        # intermediate Vector objects, the summation order and therefore the result is the same.
+        x = y = z = 0.0
+        for n, control_point in zip(N, control_points[span - p: span + 1]):
+            cx, cy, cz = control_point.xyz
+            x += n * cx
+            y += n * cy
+            z += n * cz
+        return Vector(x, y, z)
 
     def curve_derivatives(self, u: float, control_points: Sequence[Vector], n: int = 1) -> List[Vector]:
         # Source: The NURBS Book: Algorithm A3.2
@@ -838,11 +843,16 @@ class Basis:
                     v -= binomial_coefficient(k, i) * wders[i] * CK[k - i]
                 CK.append(v / wders[0])
         else:
-            CK = [
-                sum(basis_funcs_derivatives[k][j] * control_points[span - p + j]
-                    for j in range(p + 1))
-                for k in range(n + 1)
-            ]
+            # coordinates of the control points are unpacked only once for all derivatives
+            coordinates = [control_point.xyz for control_point in control_points[span - p: span + 1]]
+            CK = []
+            for k in range(n + 1):
+                x = y = z = 0.0
+                for d, (cx, cy, cz) in zip(basis_funcs_derivatives[k], coordinates):
+                    x += d * cx
+                    y += d * cy
+                    z += d * cz
+                CK.append(Vector(x, y, z))
         return CK
 
 
@@ -995,8 +1005,9 @@ class BSpline:
             t: parameter in range [0, max_t]
 
         """
-        if math.isclose(t, self.max_t):
-            t = self.max_t
+        max_t = self.max_t
+        if math.isclose(t, max_t):
+            t = max_t
         return self.basis.curve_point(t, self.control_points)
 
     def points(self, t: Iterable[float]) -> Iterable[Vector]:
@@ -1007,8 +1018,14 @@ class BSpline:
             t: parameters in range [0, max_t]
 
         """
+        # bind loop invariants once for all parameters
+        max_t = self.max_t
+        curve_point = self.basis.curve_point
+        control_points = self.control_points
         for u in t:
-            yield self.point(u)
+            if math.isclose(u, max_t):
+                u = max_t
+            yield curve_point(u, control_points)
 
     def derivative(self, t: float, n: int = 2) -> List[Vector]:
         """
@@ -1024,8 +1041,9 @@ class BSpline:
             n+1 values as :class:`Vector` objects
 
         """
-        if math.isclose(t, self.max_t):
-            t = self.max_t
+        max_t = self.max_t
+        if math.isclose(t, max_t):
+            t = max_t
         return self.basis.curve_derivatives(t, self.control_points, n)
 
     def derivatives(self, t: Iterable[float], n: int = 2) -> Iterable[List[Vector]]:
@@ -1042,8 +1060,14 @@ class BSpline:
             List of n+1 values as :class:`Vector` objects
 
         """
+        # bind loop invariants once for all parameters
+        max_t = self.max_t
+        curve_derivatives = self.basis.curve_derivatives
+        control_points = self.control_points
         for u in t:
-            yield self.derivative(u, n)
+            if math.isclose(u, max_t):
+                u = max_t
+            yield curve_derivatives(u, control_points, n)
 
     def insert_knot(self, t: float) -> None:
         """
@@ -1209,15 +1233,16 @@ class BSpline:
             max_t = self.max_t
             params = [p * max_t for p in params]
         for _ in range(level - 1):
-            params = list(subdivide_params(params))
+            params = subdivide_params(params)
         return params
 
 
-def subdivide_params(p: List[float]) -> Iterable[float]:
-    for i in range(len(p) - 1):
-        yield p[i]
-        yield (p[i] + p[i + 1]) / 2.0
-    yield p[-1]
+def subdivide_params(p: List[float]) -> List[float]:
+    """ Returns parameters `p` with the midpoints of all consecutive parameters inserted. """
+    params = [0.0] * (2 * len(p) - 1)
+    params[0::2] = p
+    params[1::2] = [(start + end) / 2.0 for start, end in zip(p, p[1:])]
+    return params
 
 
 class BSplineU(BSpline):
@@ -61,8 +61,10 @@ def test_delete_all_entities(doc):
     assert modelspace_count + 5 == len(modelspace)
     assert paperspace_count + 5 == len(paperspace)
 
+    lines = list(modelspace)
     modelspace.delete_all_entities()
     assert len(modelspace) == 0
+    assert all(line.is_alive is False for line in lines)
     assert paperspace_count + 5 == len(paperspace)
 
 
@@ -62,6 +62,51 @@ def test_get_attdef(block):
     assert block.get_attdef('TAG1_Z') is None
 
 
+def test_get_attdef_tracks_changes(block):
+    attdef1 = block.get_attdef('TAG1')
+    attdef1.dxf.tag = 'TAG3'
+    assert block.get_attdef('TAG1') is None
+    assert block.get_attdef('TAG3') is attdef1
+    attdef4 = block.add_attdef('TAG4', (0, 0))
+    assert block.get_attdef('TAG4') is attdef4
+    block.delete_entity(attdef4)
+    assert block.get_attdef('TAG4') is None
+
+
+def test_attdefs_tracks_changes(block):
+    assert [attdef.dxf.tag for attdef in block.attdefs()] == ['TAG1', 'TAG2']
+    attdef3 = block.add_attdef('TAG3', (0, 0))
+    block.add_line((0, 0), (1, 0))
+    assert [attdef.dxf.tag for attdef in block.attdefs()] == ['TAG1', 'TAG2', 'TAG3']
+    block.delete_entity(attdef3)
+    assert [attdef.dxf.tag for attdef in block.attdefs()] == ['TAG1', 'TAG2']
+
+
+def test_get_attdef_first_attdef_wins_after_retagging(doc):
+    block = doc.blocks.new('RETAG')
+    attdef_b = block.add_attdef('Y', (0, 0))
+    attdef_a = block.add_attdef('X', (0, 0))
+    assert block.get_attdef('X') is attdef_a
+    # retagging does not modify the entity space
+    attdef_b.dxf.tag = 'X'
+    assert block.get_attdef('X') is attdef_b
+    assert block.get_attdef('Y') is None
+
+
+def test_attdefs_ignores_destroyed_attdefs(doc, block):
+    attdef3 = block.add_attdef('TAG3', (0, 0))
+    attdef3.dxf.flags = 2  # const
+    assert block.has_attdef('TAG3') is True
+    assert list(block.get_const_attdefs()) == [attdef3]
+    # destroy ATTDEF without removing it from the entity space
+    doc.entitydb.delete_entity(attdef3)
+    assert [attdef.dxf.tag for attdef in block.attdefs()] == ['TAG1', 'TAG2']
+    assert block.get_attdef('TAG3') is None
+    assert block.has_attdef('TAG3') is False
+    assert block.get_attdef_text('TAG3', 'DEFAULT') == 'DEFAULT'
+    assert list(block.get_const_attdefs()) == []
+
+
 def test_get_attdef_text(block):
     block.add_attdef('TAGX', insert=(0, 0), text='PRESET_TEXT')
     text = block.get_attdef_text('TAGX')
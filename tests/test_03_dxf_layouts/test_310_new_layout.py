@@ -61,3 +61,64 @@ def test_new_block_layout(doc):
 
     assert block.block_record.dxf.explode == 0
     assert block.block_record.dxf.scale == 1
+
+
+def test_get_layout_by_key(doc):
+    new_layout = doc.new_layout('mozman_layout_4')
+    key = new_layout.layout_key
+    assert doc.layouts.get_layout_by_key(key) is new_layout
+    doc.delete_layout('mozman_layout_4')
+    with pytest.raises(ezdxf.DXFKeyError):
+        doc.layouts.get_layout_by_key(key)
+
+
+def test_active_layout():
+    doc = ezdxf.new('R2000')
+    layouts = doc.layouts
+    assert layouts.active_layout().name == 'Layout1'
+    layouts.new('Layout2')
+    layouts.set_active_layout('Layout2')
+    assert layouts.active_layout().name == 'Layout2'
+    layouts.delete('Layout2')
+    assert layouts.active_layout().name == 'Layout1'
+
+
+def test_viewports_sorted_by_id(doc):
+    layout = doc.new_layout('viewports_layout')
+    for vp_id in (3, 1, 2):
+        vp = layout.add_viewport(center=(0, 0), size=(1, 1), view_center_point=(0, 0), view_height=1)
+        vp.dxf.id = vp_id
+    layout.add_line((0, 0), (1, 0))
+    assert [vp.dxf.id for vp in layout.viewports()] == [1, 2, 3]
+
+
+def test_names_in_taborder():
+    doc = ezdxf.new('R2000')
+    layouts = doc.layouts
+    layouts.new('Layout2')
+    assert layouts.names_in_taborder() == ['Model', 'Layout1', 'Layout2']
+    # cached result has to recognize modified taborder attributes
+    layouts.get('Layout2').dxf.taborder = 0
+    assert layouts.names_in_taborder() == ['Layout2', 'Model', 'Layout1']
+    layouts.rename('Layout1', 'A')
+    assert layouts.names_in_taborder() == ['Layout2', 'Model', 'A']
+
+
+def test_get_first_paperspace_layout_in_taborder():
+    doc = ezdxf.new('R2000')
+    layouts = doc.layouts
+    layouts.new('Layout2', dxfattribs={'taborder': 0})
+    assert layouts.get(None).name == 'Layout2'
+
+
+def test_viewports_cache_tracks_changes(doc):
+    layout = doc.new_layout('viewports_cache_layout')
+    vp1 = layout.add_viewport(center=(0, 0), size=(1, 1), view_center_point=(0, 0), view_height=1)
+    vp2 = layout.add_viewport(center=(0, 0), size=(1, 1), view_center_point=(0, 0), view_height=1)
+    assert layout.viewports() == [vp1, vp2]
+    vp1.dxf.id = 99
+    assert layout.viewports() == [vp2, vp1]
+    layout.delete_entity(vp2)
+    assert layout.viewports() == [vp1]
+    vp3 = layout.add_viewport(center=(0, 0), size=(1, 1), view_center_point=(0, 0), view_height=1)
+    assert layout.viewports() == [vp3, vp1]
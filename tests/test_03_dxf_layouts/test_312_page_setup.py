@@ -0,0 +1,105 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.layouts.layout import get_paper_units, get_std_scale
+
+
+@pytest.fixture
+def layout():
+    doc = ezdxf.new('R2000')
+    return doc.layout()
+
+
+def test_get_paper_units():
+    assert get_paper_units('MM') == ('MM', 1, 1.0)
+    assert get_paper_units('inches') == ('Inches', 0, 25.4)
+    with pytest.raises(ezdxf.DXFValueError):
+        get_paper_units('cm')
+
+
+def test_get_std_scale():
+    assert get_std_scale(0) == (1, 1)
+    assert get_std_scale(16) == (1, 1)
+    assert get_std_scale(25) == (1, 50)
+    assert get_std_scale(32) == (1000, 1)
+    with pytest.raises(ezdxf.DXFValueError):
+        get_std_scale(33)
+    with pytest.raises(ezdxf.DXFValueError):
+        get_std_scale(-1)
+
+
+def test_default_page_setup(layout):
+    layout.page_setup()
+    dxf = layout.dxf
+    assert dxf.paper_size == 'ezdxf_(297.00_x_210.00_MM)'
+    assert dxf.paper_width == 297
+    assert dxf.paper_height == 210
+    assert dxf.left_margin == 15
+    assert dxf.bottom_margin == 10
+    assert dxf.plot_paper_units == 1
+    assert dxf.standard_scale_type == 16
+    assert dxf.limmin == (-15, -10)
+    assert dxf.limmax == (282, 200)
+    viewports = layout.viewports()
+    assert len(viewports) == 1
+    vp = viewports[0]
+    assert vp.dxf.id == 1
+    assert vp.dxf.center.isclose((133.5, 95))
+    assert vp.dxf.width == pytest.approx(326.7)
+    assert vp.dxf.height == pytest.approx(231.0)
+
+
+def test_page_setup_inch(layout):
+    layout.page_setup(size=(11, 8.5), margins=(.5, .5, .5, .5), units='inch', offset=(1, 2), scale=(1, 50))
+    dxf = layout.dxf
+    assert dxf.paper_size == 'ezdxf_(11.00_x_8.50_Inches)'
+    assert dxf.paper_width == pytest.approx(279.4)
+    assert dxf.paper_height == pytest.approx(215.9)
+    assert dxf.left_margin == pytest.approx(12.7)
+    assert dxf.plot_origin_y_offset == pytest.approx(50.8)
+    assert dxf.scale_numerator == 1
+    assert dxf.scale_denominator == 50
+    assert dxf.plot_paper_units == 0
+    assert dxf.unit_factor == pytest.approx(1 / 25.4)
+    assert dxf.limmin.isclose((-1.5, -2.5))
+    assert dxf.limmax.isclose((9.5, 6.0))
+    vp = layout.viewports()[0]
+    assert vp.dxf.center.isclose((200, 87.5))
+    assert vp.dxf.width == pytest.approx(605)
+    assert vp.dxf.height == pytest.approx(467.5)
+
+
+def test_page_setup_standard_scale(layout):
+    layout.page_setup(size=(420, 297), margins=(10, 10, 20, 20), scale=4, offset=(5, 5))
+    dxf = layout.dxf
+    assert dxf.standard_scale_type == 4
+    assert dxf.scale_numerator == 0.0625
+    assert dxf.scale_denominator == 12
+    vp = layout.viewports()[0]
+    assert vp.dxf.center.isclose((36480, 24672))
+    assert vp.dxf.width == pytest.approx(88704)
+
+
+def test_page_setup_invalid_arguments(layout):
+    with pytest.raises(ezdxf.DXFValueError):
+        layout.page_setup(rotation=4)
+    with pytest.raises(ezdxf.DXFValueError):
+        layout.page_setup(units='cm')
+    with pytest.raises(ezdxf.DXFValueError):
+        layout.page_setup(scale=(0, 1))
+    with pytest.raises(ezdxf.DXFValueError):
+        layout.page_setup(scale=33)
+    with pytest.raises(ezdxf.DXFTypeError):
+        layout.page_setup(scale=1.5)
+
+
+def test_configure_plot_flags(layout):
+    dxf = layout.dxf
+    dxf.plot_layout_flags = layout.USE_STANDARD_SCALE | layout.PLOT_HIDDEN
+    layout.configure_plot_flags(plot_centered=True, show_plot_styles=True, use_standard_scale=False)
+    assert dxf.plot_layout_flags == layout.PLOT_CENTERED | layout.SHOW_PLOT_STYLES | layout.PLOT_HIDDEN
+    layout.configure_plot_flags()
+    assert dxf.plot_layout_flags == layout.PLOT_CENTERED | layout.SHOW_PLOT_STYLES | layout.PLOT_HIDDEN
+    with pytest.raises(ezdxf.DXFValueError):
+        layout.configure_plot_flags(plot_everything=True)
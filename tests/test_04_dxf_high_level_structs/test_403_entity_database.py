@@ -42,6 +42,21 @@ def test_delete_entity():
     assert len(db) == 0
 
 
+def test_delete_entities():
+    db = EntityDB()
+    entity1 = DXFEntity.from_text("0\nTEST\n5\nFFFF\n")
+    entity2 = DXFEntity.from_text("0\nTEST\n5\nFFFE\n")
+    entity3 = DXFEntity.from_text("0\nTEST\n5\nFFFD\n")
+    for entity in (entity1, entity2, entity3):
+        db.add(entity)
+    entity3.destroy()
+    # dead entities are ignored like by delete_entity()
+    db.delete_entities([entity1, entity2, entity3])
+    assert entity1.is_alive is False
+    assert entity2.is_alive is False
+    assert list(db.keys()) == ['FFFD']
+
+
 def test_delete_dead_entity_entity():
     db = EntityDB()
     entity = DXFEntity.from_text("0\nTEST\n5\nFFFF\n")
@@ -471,3 +471,14 @@ ENDBLK
   0
 ENDSEC
 """
+
+
+def test_swap_block_names(dxf2000_blocks):
+    block1 = dxf2000_blocks.new('SWAP1')
+    block2 = dxf2000_blocks.new('SWAP2')
+    dxf2000_blocks.swap_block_names('swap1', 'SWAP2')
+    assert block1.name == 'SWAP2'
+    assert block1.block.dxf.name == 'SWAP2'
+    assert block2.name == 'SWAP1'
+    assert dxf2000_blocks['SWAP1'] is block2
+    assert dxf2000_blocks['SWAP2'] is block1
@@ -1,36 +1,41 @@
 # Created: 06.01.2012
 # Copyright (c) 2012-2020 Manfred Moitzi
 # License: MIT License
-from math import isclose
 import random
-from ezdxf.math.bspline import BSpline, Vector
+import pytest
+from ezdxf.math.bspline import BSpline, BSplineU, Vector
 from ezdxf.math.bspline import bspline_basis_vector, Basis, open_uniform_knot_vector, normalize_knots, subdivide_params
 import bisect
 
-DEFPOINTS = [(0.0, 0.0, 0.0), (10., 20., 20.), (30., 10., 25.), (40., 10., 25.), (50., 0., 30.)]
+# immutable, shared by all tests
+DEFPOINTS = ((0.0, 0.0, 0.0), (10., 20., 20.), (30., 10., 25.), (40., 10., 25.), (50., 0., 30.))
 
+# seeded for reproducible test failures, shared by all random comparison tests
+RNG = random.Random(0)
 
-def random_point_comparision_to_nurbs_python(spline: BSpline, count: int = 10):
-    curve = spline.to_nurbs_python_curve()
-    for _ in range(count):
-        t = random.random()
-        p1 = spline.point(t)
-        p2 = curve.evaluate_single(t)
+
+@pytest.fixture(scope='module')
+def quadratic_spline():
+    spline = BSpline(DEFPOINTS, order=3)
+    return spline, spline.to_nurbs_python_curve()
+
+
+def random_point_comparision_to_nurbs_python(spline: BSpline, curve, count: int = 10):
+    params = [RNG.random() for _ in range(count)]
+    for p1, p2 in zip(spline.points(params), curve.evaluate_list(params)):
         assert p1.isclose(p2)
 
 
-def random_derivatives_comparision_to_nurbs_python(spline: BSpline, count: int = 10):
-    curve = spline.to_nurbs_python_curve()
-    for _ in range(count):
-        t = random.random()
-        p1, d1_1, d2_1 = spline.derivative(t, n=2)
+def random_derivatives_comparision_to_nurbs_python(spline: BSpline, curve, count: int = 10):
+    params = [RNG.random() for _ in range(count)]
+    for t, (p1, d1_1, d2_1) in zip(params, spline.derivatives(params, n=2)):
         p2, d1_2, d2_2 = curve.derivatives(t, order=2)
         assert p1.isclose(p2)
         assert d1_1.isclose(d1_2)
         assert d2_1.isclose(d2_2)
 
 
-def _bisect():
+def test_bisect():
     def find_span(u: float):
         low = spline.degree
         high = spline.basis.count
@@ -44,6 +49,25 @@ def _bisect():
         assert find_span(t) == expected
 
 
+def test_find_span_of_unclamped_knots():
+    def linear_search(u: float):
+        for span in range(count):
+            if knots[span] > u:
+                return span - 1
+        return count - 1
+
+    spline = BSplineU(DEFPOINTS, order=3)
+    knots = spline.basis.knots
+    count = spline.basis.count
+    degree = spline.degree
+    assert knots[degree] != 0.0
+    for t in (2, 2.5, 3, 3.9, 4, 5, 7.5, 8):
+        assert spline.basis.find_span(t) == linear_search(t)
+    # parameters in front of the valid domain are clamped to the first span
+    for t in (-1, 0, .5, 1, 1.9):
+        assert spline.basis.find_span(t) == degree
+
+
 def test_if_nurbs_python_is_reliable():
     # Testing for some known values, just for the case
     # that NURBS-Python is incorrect.
@@ -71,23 +95,20 @@ def test_bspline_basis_vector():
     for u in (0, 2., 2.5, 3.5, 4., max_t):
         basis = bspline_basis_vector(u, count=count, degree=degree, knots=knots)
         basis2 = basis_func.basis_vector(u)
-        assert len(basis) == len(basis2)
-        for v1, v2 in zip(basis, basis2):
-            assert isclose(v1, v2)
+        # same tolerance as math.isclose()
+        assert basis == pytest.approx(basis2, rel=1e-9, abs=0)
 
 
 def iter_points(values, n):
     return (data[n] for data in values)
 
 
-def test_bspine_points_random():
-    spline = BSpline(DEFPOINTS, order=3)
-    random_point_comparision_to_nurbs_python(spline)
+def test_bspine_points_random(quadratic_spline):
+    random_point_comparision_to_nurbs_python(*quadratic_spline)
 
 
-def test_bspine_derivatives_random():
-    spline = BSpline(DEFPOINTS, order=3)
-    random_derivatives_comparision_to_nurbs_python(spline)
+def test_bspine_derivatives_random(quadratic_spline):
+    random_derivatives_comparision_to_nurbs_python(*quadratic_spline)
 
 
 def test_normalize_knots():
@@ -233,4 +254,9 @@ def test_weired_closed_spline():
     first = spline.point(0)
     last = spline.point(spline.max_t)
     assert first.isclose(last, 1e-9) is False, 'The loaded SPLINE is not a correct closed B-spline.'
-    random_point_comparision_to_nurbs_python(spline)
+    curve = spline.to_nurbs_python_curve()
+    random_point_comparision_to_nurbs_python(spline, curve)
+    # parameters in front of knots[degree] are evaluated like NURBS-Python does
+    params = [0, .01, .05]
+    for p1, p2 in zip(spline.points(params), curve.evaluate_list(params)):
+        assert p1.isclose(p2)